@@ -1,5 +1,6 @@
-from gobo.internal.high_level.histogram import create_histogram_figure
+from gobo.internal.high_level.histogram import create_histogram_figure, create_multi_histogram_figure
 
 __all__ = [
-    'create_histogram_figure'
+    'create_histogram_figure',
+    'create_multi_histogram_figure',
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 import logging
 import math
 import warnings
@@ -41,7 +42,11 @@ def add_2d_scatter_to_figure(
 
 def create_2d_kde_credible_interval_figure(array0: npt.NDArray, array1: npt.NDArray,
                                            credible_intervals: npt.NDArray | None = None,
-                                           alphas: npt.NDArray | None = None) -> figure:
+                                           alphas: npt.NDArray | None = None,
+                                           *,
+                                           grid_resolution: int | None = None,
+                                           memory_budget: int | None = None,
+                                           dtype: npt.DTypeLike = np.float64) -> figure:
     if credible_intervals is None:
         credible_intervals = [0.39346934, 0.86466472, 0.988891]  # Equivalent of 1,2,3-sigma for 2D standard deviations.
     if alphas is None:
@@ -54,7 +59,8 @@ def create_2d_kde_credible_interval_figure(array0: npt.NDArray, array1: npt.NDAr
                              f'intervals ({len(credible_intervals)} passed).')
     figure_ = figure()
     add_2d_kde_credible_interval_to_figure(figure_, array0, array1, credible_intervals=credible_intervals,
-                                           alphas=alphas)
+                                           alphas=alphas, grid_resolution=grid_resolution,
+                                           memory_budget=memory_budget, dtype=dtype)
     return figure_
 
 
@@ -65,7 +71,10 @@ def add_2d_kde_credible_interval_to_figure(
         *,
         color: Color = default_discrete_palette.blue,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        grid_resolution: int | None = None,
+        memory_budget: int | None = None,
+        dtype: npt.DTypeLike = np.float64
 ):
     if credible_intervals is None:
         credible_intervals = [0.39346934, 0.86466472, 0.988891]  # Equivalent of 1,2,3-sigma for 2D standard deviations.
@@ -77,34 +86,59 @@ def add_2d_kde_credible_interval_to_figure(
         if len(alphas) != len(credible_intervals):
             raise ValueError(f'The number of alphas passed ({len(alphas)} passed) must match the number of credible '
                              f'intervals ({len(credible_intervals)} passed).')
+    array0 = np.asarray(array0, dtype=dtype)
+    array1 = np.asarray(array1, dtype=dtype)
     combined_marginal_2d_array = np.stack([array0, array1], axis=0)
     kde = stats.gaussian_kde(combined_marginal_2d_array)
+    if grid_resolution is None:
+        figure_pixel_width, figure_pixel_height = get_figure_pixel_size(figure_)
+        x_grid_resolution = get_grid_resolution_for_pixel_size(figure_pixel_width)
+        y_grid_resolution = get_grid_resolution_for_pixel_size(figure_pixel_height)
+    else:
+        validate_grid_resolution(grid_resolution)
+        x_grid_resolution = grid_resolution
+        y_grid_resolution = grid_resolution
     contour_x_plotting_range = get_padded_range_for_array(array0)
     contour_y_plotting_range = get_padded_range_for_array(array1)
-    x_positions = np.linspace(*contour_x_plotting_range, 1000)
-    y_positions = np.linspace(*contour_y_plotting_range, 1000)
-    x_meshgrid, y_meshgrid = np.meshgrid(x_positions, y_positions)
-    positions = np.vstack([x_meshgrid.ravel(), y_meshgrid.ravel()])
-    z_meshgrid = kde(positions).reshape(x_meshgrid.shape)
-    add_contour_to_figure(figure_, x_meshgrid, y_meshgrid, z_meshgrid, color, credible_intervals, alphas)
+    x_positions = np.linspace(*contour_x_plotting_range, x_grid_resolution, dtype=dtype)
+    y_positions = np.linspace(*contour_y_plotting_range, y_grid_resolution, dtype=dtype)
+    z_meshgrid = evaluate_2d_kde_on_grid(kde, x_positions, y_positions, memory_budget=memory_budget, dtype=dtype)
+    add_contour_to_figure(figure_, x_positions, y_positions, z_meshgrid, color, credible_intervals, alphas)
 
 
-def add_contour_to_figure(figure_: figure, x_meshgrid, y_meshgrid, z_meshgrid, color: Color,
+def add_contour_to_figure(figure_: figure, x: npt.NDArray, y: npt.NDArray, z_meshgrid: npt.NDArray, color: Color,
                           credible_intervals: npt.NDArray, alphas: npt.NDArray):
+    # The `x` and `y` positions can either be the 1D axes of the grid or full 2D meshgrids of the same shape as
+    # `z_meshgrid`, as with Bokeh's `contour`.
+    thresholds = get_contour_thresholds_for_credible_intervals(z_meshgrid, credible_intervals)
+    figure_.contour(x=x, y=y, z=z_meshgrid, levels=thresholds,
+                    fill_color=color, fill_alpha=alphas)
+
+
+def get_contour_thresholds_for_credible_intervals(z_meshgrid: npt.NDArray,
+                                                  credible_intervals: npt.NDArray) -> npt.NDArray:
     z = z_meshgrid.ravel()
     sorted_z = np.sort(z)[::-1]
-    cumulative_density = np.cumsum(sorted_z) / np.sum(sorted_z)
+    # Accumulate in float64 regardless of the grid's dtype, as float32 sums lose precision over large grids.
+    cumulative_density = np.cumsum(sorted_z, dtype=np.float64)
+    cumulative_density /= cumulative_density[-1]
     threshold_indexes = np.searchsorted(cumulative_density, credible_intervals)
     thresholds = sorted_z[threshold_indexes]
     thresholds = thresholds[::-1]
-    thresholds = np.concatenate([thresholds, np.array([np.max(sorted_z)])])
-    figure_.contour(x=x_meshgrid, y=y_meshgrid, z=z_meshgrid, levels=thresholds,
-                    fill_color=color, fill_alpha=alphas)
+    thresholds = np.concatenate([thresholds, np.array([np.max(sorted_z)], dtype=sorted_z.dtype)])
+    return thresholds
 
 
-def create_1d_kde_credible_interval_figure(array: npt.NDArray) -> figure:
+def create_1d_kde_credible_interval_figure(
+        array: npt.NDArray,
+        *,
+        grid_resolution: int | None = None,
+        memory_budget: int | None = None,
+        dtype: npt.DTypeLike = np.float64
+) -> figure:
     figure_ = figure()
-    add_1d_kde_credible_interval_to_figure(figure_, array)
+    add_1d_kde_credible_interval_to_figure(figure_, array, grid_resolution=grid_resolution,
+                                           memory_budget=memory_budget, dtype=dtype)
     return figure_
 
 
@@ -112,7 +146,11 @@ def create_multi_distribution_1d_kde_credible_interval_figure(
         arrays: list[npt.NDArray],
         colors: Iterable[Color] = default_discrete_palette,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        *,
+        grid_resolution: int | None = None,
+        memory_budget: int | None = None,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     if credible_intervals is None:
         credible_intervals = [0.6827, 0.9545, 0.9973]  # Equivalent of 1,2,3-sigma for 1D standard deviations.
@@ -127,14 +165,17 @@ def create_multi_distribution_1d_kde_credible_interval_figure(
     figure_ = figure()
     for array, color in zip(arrays, colors):
         add_1d_kde_credible_interval_to_figure(figure_, array, color=color, credible_intervals=credible_intervals,
-                                               alphas=alphas)
+                                               alphas=alphas, grid_resolution=grid_resolution,
+                                               memory_budget=memory_budget, dtype=dtype)
     return figure_
 
 
 def add_1d_histogram_credible_interval_to_figure(
         figure_: figure, array: npt.NDArray, color: Color,
     credible_intervals: npt.NDArray | None = None,
-    alphas: npt.NDArray | None = None
+    alphas: npt.NDArray | None = None,
+    *,
+    dtype: npt.DTypeLike = np.float64
 ):
     if credible_intervals is None:
         credible_intervals = [0.6827, 0.9545, 0.9973]  # Equivalent of 1,2,3-sigma for 1D standard deviations.
@@ -146,7 +187,9 @@ def add_1d_histogram_credible_interval_to_figure(
         if len(alphas) != len(credible_intervals):
             raise ValueError(f'The number of alphas passed ({len(alphas)} passed) must match the number of credible '
                              f'intervals ({len(credible_intervals)} passed).')
+    array = np.asarray(array, dtype=dtype)
     histogram_values, histogram_edges = np.histogram(array, bins=60, density=True)
+    histogram_values = histogram_values.astype(dtype, copy=False)
     histogram_centers = (histogram_edges[1:] + histogram_edges[:-1]) / 2
     add_1d_credible_interval_contour_to_figure(figure_, histogram_centers, histogram_values, color,
                                                credible_intervals, alphas)
@@ -156,7 +199,9 @@ def create_multi_distribution_1d_histogram_credible_interval_figure(
         arrays: list[npt.NDArray],
         colors: Iterable[Color] = default_discrete_palette,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        *,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     if credible_intervals is None:
         credible_intervals = [0.6827, 0.9545, 0.9973]  # Equivalent of 1,2,3-sigma for 1D standard deviations.
@@ -171,37 +216,45 @@ def create_multi_distribution_1d_histogram_credible_interval_figure(
     figure_ = figure()
     for array, color in zip(arrays, colors):
         add_1d_histogram_credible_interval_to_figure(figure_, array, color, credible_intervals=credible_intervals,
-                                                     alphas=alphas)
+                                                     alphas=alphas, dtype=dtype)
     return figure_
 
 
 def create_1d_histogram_credible_interval_figure(
         array: npt.NDArray,
         *,
-        color: Color = default_discrete_palette.blue
+        color: Color = default_discrete_palette.blue,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     figure_ = figure()
-    add_1d_histogram_credible_interval_to_figure(figure_, array, color)
+    add_1d_histogram_credible_interval_to_figure(figure_, array, color, dtype=dtype)
     return figure_
 
 
 def create_multi_distribution_2d_kde_credible_interval_figure(
         array_pairs: list[tuple[npt.NDArray, npt.NDArray]],
         colors: Iterable[Color] = default_discrete_palette,
+        *,
+        grid_resolution: int | None = None,
+        memory_budget: int | None = None,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     figure_ = figure()
     for array_pair, color in zip(array_pairs, colors):
-        add_2d_kde_credible_interval_to_figure(figure_, *array_pair, color=color)
+        add_2d_kde_credible_interval_to_figure(figure_, *array_pair, color=color, grid_resolution=grid_resolution,
+                                               memory_budget=memory_budget, dtype=dtype)
     return figure_
 
 
 def create_multi_distribution_2d_histogram_figure(
         array_pairs: list[tuple[npt.NDArray, npt.NDArray]],
         colors: Iterable[Color] = default_discrete_palette,
+        *,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     figure_ = figure()
     for array_pair, color in zip(array_pairs, colors):
-        add_2d_histogram_to_figure(figure_, *array_pair, color=color)
+        add_2d_histogram_to_figure(figure_, *array_pair, color=color, dtype=dtype)
     return figure_
 
 
@@ -209,7 +262,9 @@ def create_multi_distribution_2d_histogram_credible_interval_contour_figure(
         array_pairs: list[tuple[npt.NDArray, npt.NDArray]],
         colors: Iterable[Color] = default_discrete_palette,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        *,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     if credible_intervals is None:
         credible_intervals = [0.39346934, 0.86466472, 0.988891]  # Equivalent of 1,2,3-sigma for 2D standard deviations.
@@ -224,7 +279,7 @@ def create_multi_distribution_2d_histogram_credible_interval_contour_figure(
     figure_ = figure()
     for array_pair, color in zip(array_pairs, colors):
         add_2d_histogram_credible_interval_contour_to_figure(
-            figure_, *array_pair, color=color, credible_intervals=credible_intervals, alphas=alphas)
+            figure_, *array_pair, color=color, credible_intervals=credible_intervals, alphas=alphas, dtype=dtype)
     return figure_
 
 
@@ -232,10 +287,11 @@ def create_2d_histogram_credible_interval_contour_figure(
         array0: npt.NDArray,
         array1: npt.NDArray,
         *,
-        color: Color = default_discrete_palette.blue
+        color: Color = default_discrete_palette.blue,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     figure_ = figure()
-    add_2d_histogram_credible_interval_contour_to_figure(figure_, array0, array1, color=color)
+    add_2d_histogram_credible_interval_contour_to_figure(figure_, array0, array1, color=color, dtype=dtype)
     return figure_
 
 
@@ -243,10 +299,11 @@ def create_2d_histogram_figure(
         array0: npt.NDArray,
         array1: npt.NDArray,
         *,
-        color: Color = default_discrete_palette.blue
+        color: Color = default_discrete_palette.blue,
+        dtype: npt.DTypeLike = np.float64
 ) -> figure:
     figure_ = figure()
-    add_2d_histogram_to_figure(figure_, array0, array1, color=color)
+    add_2d_histogram_to_figure(figure_, array0, array1, color=color, dtype=dtype)
     return figure_
 
 
@@ -255,9 +312,13 @@ def add_2d_histogram_to_figure(
         array0: npt.NDArray,
         array1: npt.NDArray,
         *,
-        color: Color = default_discrete_palette.blue
+        color: Color = default_discrete_palette.blue,
+        dtype: npt.DTypeLike = np.float64
 ):
+    array0 = np.asarray(array0, dtype=dtype)
+    array1 = np.asarray(array1, dtype=dtype)
     histogram_values, histogram_edges0, histogram_edges1 = np.histogram2d(array0, array1, bins=30, density=True)
+    histogram_values = histogram_values.astype(dtype, copy=False)
     histogram_maximum = np.max(histogram_values)
     histogram_normalized = histogram_values / histogram_maximum
     image_width = histogram_edges0[-1] - histogram_edges0[0]
@@ -276,7 +337,8 @@ def add_2d_histogram_credible_interval_contour_to_figure(
         *,
         color: Color = default_discrete_palette.blue,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        dtype: npt.DTypeLike = np.float64
 ):
     if credible_intervals is None:
         credible_intervals = [0.39346934, 0.86466472, 0.988891]  # Equivalent of 1,2,3-sigma for 2D standard deviations.
@@ -288,7 +350,10 @@ def add_2d_histogram_credible_interval_contour_to_figure(
         if len(alphas) != len(credible_intervals):
             raise ValueError(f'The number of alphas passed ({len(alphas)} passed) must match the number of credible '
                              f'intervals ({len(credible_intervals)} passed).')
+    array0 = np.asarray(array0, dtype=dtype)
+    array1 = np.asarray(array1, dtype=dtype)
     histogram_values, histogram_edges0, histogram_edges1 = np.histogram2d(array0, array1, bins=[30, 30], density=True)
+    histogram_values = histogram_values.astype(dtype, copy=False)
     histogram_centers0 = (histogram_edges0[1:] + histogram_edges0[:-1]) / 2
     histogram_centers1 = (histogram_edges1[1:] + histogram_edges1[:-1]) / 2
     x_meshgrid, y_meshgrid = np.meshgrid(histogram_centers0, histogram_centers1)
@@ -302,7 +367,10 @@ def add_1d_kde_credible_interval_to_figure(
         *,
         color: Color = default_discrete_palette.blue,
         credible_intervals: npt.NDArray | None = None,
-        alphas: npt.NDArray | None = None
+        alphas: npt.NDArray | None = None,
+        grid_resolution: int | None = None,
+        memory_budget: int | None = None,
+        dtype: npt.DTypeLike = np.float64
 ):
     if credible_intervals is None:
         credible_intervals = [0.6827, 0.9545, 0.9973]  # Equivalent of 1,2,3-sigma for 1D standard deviations.
@@ -314,11 +382,17 @@ def add_1d_kde_credible_interval_to_figure(
         if len(alphas) != len(credible_intervals):
             raise ValueError(f'The number of alphas passed ({len(alphas)} passed) must match the number of credible '
                              f'intervals ({len(credible_intervals)} passed).')
+    array = np.asarray(array, dtype=dtype)
     kde = stats.gaussian_kde(array)
+    if grid_resolution is None:
+        figure_pixel_width, _ = get_figure_pixel_size(figure_)
+        grid_resolution = get_grid_resolution_for_pixel_size(figure_pixel_width)
+    validate_grid_resolution(grid_resolution)
     distribution_plotting_range = get_padded_range_for_array(array)
     # Evaluate the KDE on a grid
-    plotting_positions = np.linspace(*distribution_plotting_range, 1000)
-    distribution_values = kde(plotting_positions)
+    plotting_positions = np.linspace(*distribution_plotting_range, grid_resolution, dtype=dtype)
+    distribution_values = evaluate_kde_at_positions(kde, plotting_positions[np.newaxis, :],
+                                                    memory_budget=memory_budget, dtype=dtype)
     add_1d_credible_interval_contour_to_figure(figure_, plotting_positions, distribution_values, color,
                                                credible_intervals=credible_intervals, alphas=alphas)
 
@@ -403,12 +477,86 @@ def get_indexes_for_thresholds(credible_interval_thresholds, distribution_positi
         np.array([0.5]),  # The median.
         0.5 + half_credible_interval_thresholds,  # The upper bounds of the intervals.
     ])
-    threshold_values = np.quantile(distribution_positions, quantile_thresholds, weights=distribution_values,
-                                   method='inverted_cdf')
+    # The weights are accumulated internally, so they are promoted to float64 to avoid float32 rounding in the sum.
+    threshold_values = np.quantile(distribution_positions, quantile_thresholds,
+                                   weights=distribution_values.astype(np.float64, copy=False), method='inverted_cdf')
     plotting_position_threshold_indexes = np.searchsorted(distribution_positions, threshold_values)
     return plotting_position_threshold_indexes
 
 
+def get_figure_pixel_size(figure_: figure) -> (int, int):
+    # Fall back to the full canvas size when no frame size is set.
+    pixel_width = figure_.frame_width if figure_.frame_width is not None else figure_.width
+    pixel_height = figure_.frame_height if figure_.frame_height is not None else figure_.height
+    return pixel_width, pixel_height
+
+
+def get_grid_resolution_for_pixel_size(
+        pixel_size: int,
+        *,
+        oversampling_factor: int = 2,
+        minimum_resolution: int = 50,
+        maximum_resolution: int = 1000
+) -> int:
+    grid_resolution = pixel_size * oversampling_factor
+    return int(np.clip(grid_resolution, minimum_resolution, maximum_resolution))
+
+
+def validate_grid_resolution(grid_resolution: int):
+    if grid_resolution < 2:
+        raise ValueError(f'The grid resolution must be at least 2 ({grid_resolution} passed).')
+
+
+def get_kde_evaluation_bytes_per_position(kde: stats.gaussian_kde) -> int:
+    # Each position requires its coordinates, the whitened copy scipy makes of them, and the output value. Scipy
+    # evaluates in float64 regardless of the input dtype.
+    return (2 * kde.d + 1) * np.dtype(np.float64).itemsize
+
+
+def get_kde_evaluation_chunk_size(kde: stats.gaussian_kde, memory_budget: int | None,
+                                  number_of_positions: int) -> int:
+    if memory_budget is None:
+        return number_of_positions
+    bytes_per_position = get_kde_evaluation_bytes_per_position(kde)
+    if memory_budget < bytes_per_position:
+        raise ValueError(f'The memory budget ({memory_budget} bytes) cannot hold the evaluation of a single KDE '
+                         f'position ({bytes_per_position} bytes).')
+    return min(number_of_positions, memory_budget // bytes_per_position)
+
+
+def evaluate_kde_at_positions(kde: stats.gaussian_kde, positions: npt.NDArray, *,
+                              memory_budget: int | None = None, dtype: npt.DTypeLike = np.float64) -> npt.NDArray:
+    number_of_positions = positions.shape[1]
+    chunk_size = get_kde_evaluation_chunk_size(kde, memory_budget, number_of_positions)
+    if chunk_size == number_of_positions:
+        return kde(positions).astype(dtype, copy=False)
+    values = np.empty(number_of_positions, dtype=dtype)
+    for chunk_start in range(0, number_of_positions, chunk_size):
+        chunk_end = chunk_start + chunk_size
+        values[chunk_start:chunk_end] = kde(positions[:, chunk_start:chunk_end])
+    return values
+
+
+def evaluate_2d_kde_on_grid(kde: stats.gaussian_kde, x_positions: npt.NDArray, y_positions: npt.NDArray, *,
+                            memory_budget: int | None = None, dtype: npt.DTypeLike = np.float64) -> npt.NDArray:
+    # Tiles are whole rows of the grid, so the full stacked position array is never built when a budget is given.
+    z_meshgrid = np.empty((y_positions.shape[0], x_positions.shape[0]), dtype=dtype)
+    if memory_budget is None:
+        rows_per_tile = y_positions.shape[0]
+    else:
+        bytes_per_row = get_kde_evaluation_bytes_per_position(kde) * x_positions.shape[0]
+        if memory_budget < bytes_per_row:
+            raise ValueError(f'The memory budget ({memory_budget} bytes) cannot hold the evaluation of a single KDE '
+                             f'grid row ({bytes_per_row} bytes).')
+        rows_per_tile = memory_budget // bytes_per_row
+    for row_start in range(0, y_positions.shape[0], rows_per_tile):
+        tile_y_positions = y_positions[row_start:row_start + rows_per_tile]
+        tile_x_meshgrid, tile_y_meshgrid = np.meshgrid(x_positions, tile_y_positions)
+        tile_positions = np.vstack([tile_x_meshgrid.ravel(), tile_y_meshgrid.ravel()])
+        z_meshgrid[row_start:row_start + rows_per_tile] = kde(tile_positions).reshape(tile_x_meshgrid.shape)
+    return z_meshgrid
+
+
 def get_range_1d_for_array(array: npt.NDArray, padding_fraction: float = 0.05) -> Range1d:
     range_start, range_end = get_padded_range_for_array(array, padding_fraction)
     range_1d = Range1d(start=range_start, end=range_end)
@@ -425,6 +573,21 @@ def get_padded_range_for_array(array, padding_fraction: float = 0.05) -> (float,
     return range_start, range_end
 
 
+def get_sub_figure_kwargs_for_function(figure_function: Callable, sub_figure_kwargs: dict[Any, Any],
+                                        subfigure_size: int) -> dict[Any, Any]:
+    # Sub-figures are created before they are sized for the corner plot, so functions that evaluate on a grid are
+    # given a resolution derived from the subfigure size instead of their default figure size.
+    if 'grid_resolution' in sub_figure_kwargs:
+        return sub_figure_kwargs
+    try:
+        parameters = inspect.signature(figure_function).parameters
+    except (TypeError, ValueError):
+        return sub_figure_kwargs
+    if 'grid_resolution' not in parameters:
+        return sub_figure_kwargs
+    return {**sub_figure_kwargs, 'grid_resolution': get_grid_resolution_for_pixel_size(subfigure_size)}
+
+
 def create_corner_plot(
         array: npt.NDArray,
         *,
@@ -451,6 +614,10 @@ def create_corner_plot(
 
     if sub_figure_kwargs is None:
         sub_figure_kwargs = {}
+    marginal_1d_sub_figure_kwargs = get_sub_figure_kwargs_for_function(marginal_1d_figure_function,
+                                                                       sub_figure_kwargs, subfigure_size)
+    marginal_2d_sub_figure_kwargs = get_sub_figure_kwargs_for_function(marginal_2d_figure_function,
+                                                                       sub_figure_kwargs, subfigure_size)
     assert len(array.shape) == 2
 
     # Prepare shared components.
@@ -471,12 +638,13 @@ def create_corner_plot(
             if row_index == column_index:  # 1D marginal distribution figures.
                 marginal_1d_array = array[:, row_index]
                 logger.info(f'Creating 1D marginal figure for row {row_index}, column {column_index}.')
-                figure_ = marginal_1d_figure_function(marginal_1d_array, **sub_figure_kwargs)
+                figure_ = marginal_1d_figure_function(marginal_1d_array, **marginal_1d_sub_figure_kwargs)
             if row_index > column_index:  # 2D marginal distribution figures.
                 marginal_2d_array0 = array[:, column_index]
                 marginal_2d_array1 = array[:, row_index]
                 logger.info(f'Creating 2D marginal figure for row {row_index}, column {column_index}.')
-                figure_ = marginal_2d_figure_function(marginal_2d_array0, marginal_2d_array1, **sub_figure_kwargs)
+                figure_ = marginal_2d_figure_function(marginal_2d_array0, marginal_2d_array1,
+                                                      **marginal_2d_sub_figure_kwargs)
             if figure_ is not None:
                 compose_figure_for_corner_plot_position(figure_, column_index, row_index, number_of_parameters,
                                                         dimension_labels, x_ranges, y_ranges, toolbar, subfigure_size,
@@ -517,6 +685,10 @@ def create_multi_distribution_corner_plot(
 
     if sub_figure_kwargs is None:
         sub_figure_kwargs = {}
+    marginal_1d_sub_figure_kwargs = get_sub_figure_kwargs_for_function(marginal_1d_figure_function,
+                                                                       sub_figure_kwargs, subfigure_size)
+    marginal_2d_sub_figure_kwargs = get_sub_figure_kwargs_for_function(marginal_2d_figure_function,
+                                                                       sub_figure_kwargs, subfigure_size)
 
     number_of_dimensions = arrays[0].shape[1]
     for array in arrays:
@@ -544,11 +716,11 @@ def create_multi_distribution_corner_plot(
             if row_index == column_index:  # 1D marginal distribution figures.
                 marginal_1d_arrays = [array[:, row_index] for array in arrays]
                 logger.info(f'Creating 1D marginal figure for row {row_index}, column {column_index}.')
-                figure_ = marginal_1d_figure_function(marginal_1d_arrays, **sub_figure_kwargs)
+                figure_ = marginal_1d_figure_function(marginal_1d_arrays, **marginal_1d_sub_figure_kwargs)
             if row_index > column_index:  # 2D marginal distribution figures.
                 marginal_2d_array_pairs = [(array[:, column_index], array[:, row_index]) for array in arrays]
                 logger.info(f'Creating 2D marginal figure for row {row_index}, column {column_index}.')
-                figure_ = marginal_2d_figure_function(marginal_2d_array_pairs, **sub_figure_kwargs)
+                figure_ = marginal_2d_figure_function(marginal_2d_array_pairs, **marginal_2d_sub_figure_kwargs)
             if figure_ is not None:
                 compose_figure_for_corner_plot_position(figure_, column_index, row_index, number_of_dimensions,
                                                         dimension_labels, x_ranges, y_ranges, toolbar, subfigure_size,
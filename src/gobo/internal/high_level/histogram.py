@@ -1,15 +1,39 @@
+from __future__ import annotations
+
+import numpy as np
 from bokeh.plotting import figure
 from numpy import typing as npt
 
-from gobo.internal.histogram import add_1d_histogram_to_figure
+from gobo.internal.histogram import add_1d_histogram_to_figure, add_multi_1d_histogram_to_figure, HistogramData
 
 
 def create_histogram_figure(
-        data: npt.NDArray,
+        data: HistogramData,
+        *args,
+        bins: int | str | npt.NDArray = 30,
+        dtype: npt.DTypeLike = np.float64,
+        range_: tuple[float, float] | None = None,
+        sample_size: int = 10_000,
+        chunk_size: int = 1_000_000,
+        **kwargs,
+) -> figure:
+    figure_ = figure(*args, **kwargs)
+    add_1d_histogram_to_figure(figure_, data, bins=bins, dtype=dtype, range_=range_, sample_size=sample_size,
+                               chunk_size=chunk_size)
+    return figure_
+
+
+def create_multi_histogram_figure(
+        datas: list[HistogramData],
         *args,
-        bins: int = 30,
+        bins: int | str | npt.NDArray = 30,
+        dtype: npt.DTypeLike = np.float64,
+        range_: tuple[float, float] | None = None,
+        sample_size: int = 10_000,
+        chunk_size: int = 1_000_000,
         **kwargs,
 ) -> figure:
     figure_ = figure(*args, **kwargs)
-    add_1d_histogram_to_figure(figure_, data, bins=bins)
+    add_multi_1d_histogram_to_figure(figure_, datas, bins=bins, dtype=dtype, range_=range_,
+                                     sample_size=sample_size, chunk_size=chunk_size)
     return figure_
@@ -1,5 +1,14 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
 import numpy.typing as npt
+from bokeh.document import Document
 from bokeh.io import show
+from bokeh.layouts import column
+from bokeh.models import ColumnDataSource, CustomJS, Spinner, Column, Slider
 from bokeh.plotting import figure
 
 from gobo.internal.palette import default_discrete_palette
@@ -7,12 +16,302 @@ from gobo.internal.palette import default_discrete_palette
 
 def create_light_curve_figure(times: npt.NDArray, fluxes: npt.NDArray) -> figure:
     light_curve_figure = figure(x_axis_label='Time', y_axis_label='Flux')
-    light_curve_figure.scatter(x=times, y=fluxes, line_color=default_discrete_palette.blue, line_alpha=0.7,
-                               fill_color=default_discrete_palette.blue, fill_alpha=0.5)
-    light_curve_figure.line(x=times, y=fluxes, line_alpha=0.2, line_color=default_discrete_palette.blue)
+    light_curve_source = ColumnDataSource(data={'time': times, 'flux': fluxes})
+    add_light_curve_source_to_figure(light_curve_figure, light_curve_source)
     return light_curve_figure
 
 
+def add_light_curve_source_to_figure(light_curve_figure: figure, light_curve_source: ColumnDataSource) -> None:
+    light_curve_figure.scatter(x='time', y='flux', source=light_curve_source,
+                               line_color=default_discrete_palette.blue, line_alpha=0.7,
+                               fill_color=default_discrete_palette.blue, fill_alpha=0.5)
+    light_curve_figure.line(x='time', y='flux', source=light_curve_source, line_alpha=0.2,
+                            line_color=default_discrete_palette.blue)
+
+
 def show_light_curve(times: npt.NDArray, fluxes: npt.NDArray) -> None:
     light_curve_figure = create_light_curve_figure(times, fluxes)
     show(light_curve_figure)
+
+
+class LightCurveCollection:
+    # The times and fluxes of all light curves are concatenated, and light curve `i` spans `offsets[i]` to
+    # `offsets[i + 1]` in the concatenated arrays.
+    def __init__(self, times: npt.NDArray, fluxes: npt.NDArray, offsets: npt.NDArray):
+        # `np.asanyarray` keeps memory-mapped arrays as memory maps rather than copying them.
+        times = np.asanyarray(times)
+        fluxes = np.asanyarray(fluxes)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if times.shape != fluxes.shape or len(times.shape) != 1:
+            raise ValueError(f'The times and fluxes must be 1D arrays of the same length (shapes {times.shape} and '
+                             f'{fluxes.shape} passed).')
+        if len(offsets.shape) != 1 or offsets.shape[0] < 1 or offsets[0] != 0 or offsets[-1] != times.shape[0]:
+            raise ValueError('The offsets must be a 1D array starting at 0 and ending at the length of the '
+                             'concatenated times and fluxes.')
+        if np.any(np.diff(offsets) < 0):
+            raise ValueError('The offsets must be non-decreasing.')
+        self.times: npt.NDArray = times
+        self.fluxes: npt.NDArray = fluxes
+        self.offsets: npt.NDArray = offsets
+
+    @classmethod
+    def from_light_curves(cls, light_curves: Iterable[tuple[npt.NDArray, npt.NDArray]]) -> LightCurveCollection:
+        times_list = []
+        fluxes_list = []
+        lengths = [0]
+        for times, fluxes in light_curves:
+            times_list.append(np.asarray(times))
+            fluxes_list.append(np.asarray(fluxes))
+            lengths.append(times_list[-1].shape[0])
+        offsets = np.cumsum(lengths, dtype=np.int64)
+        if len(times_list) == 0:
+            return cls(np.array([]), np.array([]), offsets)
+        return cls(np.concatenate(times_list), np.concatenate(fluxes_list), offsets)
+
+    def save(self, directory: Path | str) -> None:
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory.joinpath('times.npy'), self.times)
+        np.save(directory.joinpath('fluxes.npy'), self.fluxes)
+        np.save(directory.joinpath('offsets.npy'), self.offsets)
+
+    @classmethod
+    def load(cls, directory: Path | str, *, memory_map: bool = True) -> LightCurveCollection:
+        directory = Path(directory)
+        mmap_mode = 'r' if memory_map else None
+        times = np.load(directory.joinpath('times.npy'), mmap_mode=mmap_mode)
+        fluxes = np.load(directory.joinpath('fluxes.npy'), mmap_mode=mmap_mode)
+        offsets = np.load(directory.joinpath('offsets.npy'))
+        return cls(times, fluxes, offsets)
+
+    def __len__(self) -> int:
+        return self.offsets.shape[0] - 1
+
+    def __getitem__(self, index: int) -> tuple[npt.NDArray, npt.NDArray]:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f'Light curve index {index} is out of range for a collection of {len(self)} light '
+                             f'curves.')
+        index = index % len(self)
+        start = self.offsets[index]
+        end = self.offsets[index + 1]
+        return self.times[start:end], self.fluxes[start:end]
+
+
+def create_light_curve_viewer_components(
+        light_curve_collection: LightCurveCollection,
+        *,
+        names: list[str] | None = None,
+        initial_index: int = 0,
+) -> (figure, ColumnDataSource, Spinner):
+    if names is not None and len(names) != len(light_curve_collection):
+        raise ValueError(f'The number of names ({len(names)} passed) must match the number of light curves '
+                         f'({len(light_curve_collection)} in the collection).')
+    times, fluxes = light_curve_collection[initial_index]
+    # Negative indexes are normalized so the spinner and the callbacks see the same index.
+    initial_index = initial_index % len(light_curve_collection)
+    light_curve_source = ColumnDataSource(data={'time': np.asarray(times), 'flux': np.asarray(fluxes)})
+    title = names[initial_index] if names is not None else f'Light curve {initial_index}'
+    light_curve_figure = figure(x_axis_label='Time', y_axis_label='Flux', title=title)
+    add_light_curve_source_to_figure(light_curve_figure, light_curve_source)
+    spinner = Spinner(title='Light curve index', mode='int', low=0, high=len(light_curve_collection) - 1, step=1,
+                      value=initial_index)
+    return light_curve_figure, light_curve_source, spinner
+
+
+def create_light_curve_viewer(
+        light_curve_collection: LightCurveCollection,
+        *,
+        names: list[str] | None = None,
+        initial_index: int = 0,
+) -> Column:
+    # The collection is sent to the browser once, as a single store data source, and switching the light curve
+    # slices it out of the store in the browser without rebuilding the figure.
+    light_curve_figure, light_curve_source, spinner = create_light_curve_viewer_components(
+        light_curve_collection, names=names, initial_index=initial_index)
+    store_source = ColumnDataSource(data={'time': np.asarray(light_curve_collection.times),
+                                          'flux': np.asarray(light_curve_collection.fluxes)})
+    switch_light_curve_callback = CustomJS(
+        args={
+            'store_source': store_source,
+            'light_curve_source': light_curve_source,
+            'offsets': light_curve_collection.offsets.tolist(),
+            'names': names,
+            'title': light_curve_figure.title,
+        },
+        code='''
+            const index = Math.round(cb_obj.value);
+            const start = offsets[index];
+            const end = offsets[index + 1];
+            light_curve_source.data = {
+                time: store_source.data.time.slice(start, end),
+                flux: store_source.data.flux.slice(start, end),
+            };
+            title.text = names === null ? `Light curve ${index}` : names[index];
+        ''')
+    spinner.js_on_change('value', switch_light_curve_callback)
+    return column(spinner, light_curve_figure)
+
+
+def add_light_curve_viewer_to_document(
+        document: Document,
+        light_curve_collection: LightCurveCollection,
+        *,
+        names: list[str] | None = None,
+        initial_index: int = 0,
+) -> None:
+    # Only the displayed light curve is sent to the browser. It is sliced from the (possibly memory-mapped)
+    # collection on the server when the light curve index changes.
+    light_curve_figure, light_curve_source, spinner = create_light_curve_viewer_components(
+        light_curve_collection, names=names, initial_index=initial_index)
+
+    def switch_light_curve(attribute: str, old_index: int, new_index: int) -> None:
+        new_index = int(round(new_index))
+        times, fluxes = light_curve_collection[new_index]
+        light_curve_source.data = {'time': np.asarray(times), 'flux': np.asarray(fluxes)}
+        light_curve_figure.title.text = names[new_index] if names is not None else f'Light curve {new_index}'
+
+    spinner.on_change('value', switch_light_curve)
+    document.add_root(column(spinner, light_curve_figure))
+
+
+def show_light_curve_viewer(
+        light_curve_collection: LightCurveCollection,
+        *,
+        names: list[str] | None = None,
+        initial_index: int = 0,
+) -> None:
+    light_curve_viewer = create_light_curve_viewer(light_curve_collection, names=names, initial_index=initial_index)
+    show(light_curve_viewer)
+
+
+def fold_and_bin_light_curve(
+        times: npt.NDArray,
+        fluxes: npt.NDArray,
+        periods: npt.NDArray,
+        *,
+        number_of_bins: int = 100,
+        epoch: float | None = None,
+        memory_budget: int | None = None,
+) -> (npt.NDArray, npt.NDArray):
+    # Returns the phase bin centers and the mean flux of each bin for each period (NaN for empty bins), with shape
+    # [periods, bins].
+    times = np.asarray(times, dtype=np.float64)
+    fluxes = np.asarray(fluxes, dtype=np.float64)
+    periods = np.atleast_1d(np.asarray(periods, dtype=np.float64))
+    if not np.all(np.isfinite(periods) & (periods > 0)):
+        raise ValueError('The periods must all be finite and positive.')
+    if number_of_bins < 1:
+        raise ValueError(f'The number of bins must be at least 1 ({number_of_bins} passed).')
+    # Light curves routinely contain NaN fluxes (such as from gaps or flagged cadences), which are left out of the
+    # bins rather than making each bin they fall in NaN.
+    finite_mask = np.isfinite(times) & np.isfinite(fluxes)
+    times = times[finite_mask]
+    fluxes = fluxes[finite_mask]
+    if epoch is None:
+        epoch = np.min(times) if times.shape[0] > 0 else 0.0
+    relative_times = times - epoch
+    number_of_periods = periods.shape[0]
+    number_of_times = times.shape[0]
+    # The fold below works in place, so each folded point only ever has its phase, its flat bin index, and its tiled
+    # flux weight alive at once.
+    if memory_budget is None or number_of_times == 0:
+        periods_per_chunk = number_of_periods
+    else:
+        bytes_per_period = 3 * np.dtype(np.float64).itemsize * number_of_times
+        if memory_budget < bytes_per_period:
+            raise ValueError(f'The memory budget ({memory_budget} bytes) cannot hold the folding of a single period '
+                             f'({bytes_per_period} bytes).')
+        periods_per_chunk = memory_budget // bytes_per_period
+    flux_sums = np.empty((number_of_periods, number_of_bins), dtype=np.float64)
+    flux_counts = np.empty((number_of_periods, number_of_bins), dtype=np.int64)
+    for chunk_start in range(0, number_of_periods, periods_per_chunk):
+        chunk_periods = periods[chunk_start:chunk_start + periods_per_chunk]
+        number_of_chunk_periods = chunk_periods.shape[0]
+        phases = np.divide(relative_times[np.newaxis, :], chunk_periods[:, np.newaxis])
+        np.mod(phases, 1, out=phases)
+        phases *= number_of_bins
+        bin_indexes = phases.astype(np.int64)
+        del phases
+        np.minimum(bin_indexes, number_of_bins - 1, out=bin_indexes)
+        # Offset each period's bins so a single `bincount` accumulates every period in the chunk at once.
+        bin_indexes += (np.arange(number_of_chunk_periods, dtype=np.int64) * number_of_bins)[:, np.newaxis]
+        flat_bin_indexes = bin_indexes.ravel()
+        chunk_length = number_of_chunk_periods * number_of_bins
+        flux_counts[chunk_start:chunk_start + number_of_chunk_periods] = np.bincount(
+            flat_bin_indexes, minlength=chunk_length).reshape(number_of_chunk_periods, number_of_bins)
+        flux_sums[chunk_start:chunk_start + number_of_chunk_periods] = np.bincount(
+            flat_bin_indexes, weights=np.tile(fluxes, number_of_chunk_periods), minlength=chunk_length
+        ).reshape(number_of_chunk_periods, number_of_bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        binned_fluxes = np.where(flux_counts > 0, flux_sums / flux_counts, np.nan)
+    bin_centers = (np.arange(number_of_bins, dtype=np.float64) + 0.5) / number_of_bins
+    return bin_centers, binned_fluxes
+
+
+def get_folded_light_curve_title(period: float) -> str:
+    return f'Period {period:.6g}'
+
+
+def create_binned_folded_light_curve_figure(bin_centers: npt.NDArray, binned_fluxes: npt.NDArray,
+                                            period: float) -> figure:
+    folded_light_curve_figure = figure(x_axis_label='Phase', y_axis_label='Flux',
+                                       title=get_folded_light_curve_title(period),
+                                       frame_width=300, frame_height=200)
+    folded_light_curve_source = ColumnDataSource(data={'time': bin_centers, 'flux': binned_fluxes})
+    add_light_curve_source_to_figure(folded_light_curve_figure, folded_light_curve_source)
+    return folded_light_curve_figure
+
+
+def create_binned_folded_light_curve_figures(
+        times: npt.NDArray,
+        fluxes: npt.NDArray,
+        periods: npt.NDArray,
+        *,
+        number_of_bins: int = 100,
+        epoch: float | None = None,
+        memory_budget: int | None = None,
+) -> list[figure]:
+    bin_centers, binned_fluxes = fold_and_bin_light_curve(times, fluxes, periods, number_of_bins=number_of_bins,
+                                                          epoch=epoch, memory_budget=memory_budget)
+    return [create_binned_folded_light_curve_figure(bin_centers, period_binned_fluxes, period)
+            for period, period_binned_fluxes in zip(np.atleast_1d(periods), binned_fluxes)]
+
+
+def create_folded_light_curve_period_viewer(
+        times: npt.NDArray,
+        fluxes: npt.NDArray,
+        periods: npt.NDArray,
+        *,
+        number_of_bins: int = 100,
+        epoch: float | None = None,
+        memory_budget: int | None = None,
+) -> Column:
+    # The binned folded fluxes for every period are precomputed and sent once, and moving the period slider slices
+    # the displayed period's bins out of them in the browser.
+    periods = np.atleast_1d(np.asarray(periods, dtype=np.float64))
+    bin_centers, binned_fluxes = fold_and_bin_light_curve(times, fluxes, periods, number_of_bins=number_of_bins,
+                                                          epoch=epoch, memory_budget=memory_budget)
+    folded_light_curve_figure = create_binned_folded_light_curve_figure(bin_centers, binned_fluxes[0], periods[0])
+    folded_light_curve_source = folded_light_curve_figure.renderers[0].data_source
+    store_source = ColumnDataSource(data={'flux': binned_fluxes.ravel()})
+    slider = Slider(title='Period index', start=0, end=max(periods.shape[0] - 1, 1), step=1, value=0,
+                    disabled=periods.shape[0] == 1)
+    switch_period_callback = CustomJS(
+        args={
+            'store_source': store_source,
+            'folded_light_curve_source': folded_light_curve_source,
+            'titles': [get_folded_light_curve_title(period) for period in periods],
+            'number_of_bins': number_of_bins,
+            'title': folded_light_curve_figure.title,
+        },
+        code='''
+            const index = Math.round(cb_obj.value);
+            const start = index * number_of_bins;
+            folded_light_curve_source.data = {
+                time: folded_light_curve_source.data.time,
+                flux: store_source.data.flux.slice(start, start + number_of_bins),
+            };
+            title.text = titles[index];
+        ''')
+    slider.js_on_change('value', switch_period_callback)
+    return column(slider, folded_light_curve_figure)
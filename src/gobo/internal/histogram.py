@@ -1,20 +1,305 @@
 from __future__ import annotations
 
-from typing import Callable, Any
+import itertools
+from typing import Callable, Any, Iterable, Iterator, Union
 
 import numpy as np
+from bokeh.colors import Color
 from bokeh.plotting import figure
 from numpy import typing as npt
+from scipy.special import gammaln
 
+from gobo.internal.palette import default_discrete_palette
 
-def create_histogram_figure(array: npt.NDArray, *, bins: int = 30, figure_function: Callable[[..., Any], figure] | None = None) -> figure:
+HistogramData = Union[npt.NDArray, Iterable[npt.NDArray]]
+
+
+def create_histogram_figure(array: HistogramData, *, bins: int | str | npt.NDArray = 30,
+                            figure_function: Callable[[..., Any], figure] | None = None,
+                            dtype: npt.DTypeLike = np.float64, range_: tuple[float, float] | None = None,
+                            sample_size: int = 10_000, chunk_size: int = 1_000_000) -> figure:
     if figure_function is None:
         figure_function = figure
     figure_ = figure_function()
-    add_1d_histogram_to_figure(figure_, array, bins=bins)
+    add_1d_histogram_to_figure(figure_, array, bins=bins, dtype=dtype, range_=range_, sample_size=sample_size,
+                               chunk_size=chunk_size)
     return figure_
 
 
-def add_1d_histogram_to_figure(figure_, array, *, bins):
-    hist, edges = np.histogram(array, density=True, bins=bins)
-    figure_.quad(top=hist, bottom=0, left=edges[:-1], right=edges[1:], line_color="white")
+def add_1d_histogram_to_figure(figure_, array: HistogramData, *, bins: int | str | npt.NDArray,
+                               dtype: npt.DTypeLike = np.float64, range_: tuple[float, float] | None = None,
+                               sample_size: int = 10_000, chunk_size: int = 1_000_000):
+    hist, edges = create_multi_histogram_densities([array], bins=bins, dtype=dtype, range_=range_,
+                                                   sample_size=sample_size, chunk_size=chunk_size)
+    figure_.quad(top=hist[0], bottom=0, left=edges[:-1], right=edges[1:], line_color="white")
+
+
+def add_multi_1d_histogram_to_figure(figure_, arrays: list[HistogramData], *, bins: int | str | npt.NDArray,
+                                     colors: Iterable[Color] = default_discrete_palette,
+                                     dtype: npt.DTypeLike = np.float64, range_: tuple[float, float] | None = None,
+                                     sample_size: int = 10_000, chunk_size: int = 1_000_000):
+    hists, edges = create_multi_histogram_densities(arrays, bins=bins, dtype=dtype, range_=range_,
+                                                    sample_size=sample_size, chunk_size=chunk_size)
+    for hist, color in zip(hists, colors):
+        figure_.quad(top=hist, bottom=0, left=edges[:-1], right=edges[1:], line_color="white", fill_color=color,
+                     fill_alpha=0.5)
+
+
+# Binning methods estimated by gobo from a sample of the data. Other string binning methods are delegated to NumPy.
+sampled_binning_methods = ('freedman_diaconis', 'knuth')
+
+# Streamed Freedman-Diaconis histograms are first counted on this many fine bins, as the number of values (which sets
+# the bin width) is only known once the stream is consumed. It is highly composite, so the fine bins can be merged
+# into nearly any final bin count.
+freedman_diaconis_fine_bin_count = 10080
+
+
+def create_multi_histogram_densities(
+        arrays: list[HistogramData],
+        *,
+        bins: int | str | npt.NDArray,
+        dtype: npt.DTypeLike = np.float64,
+        range_: tuple[float, float] | None = None,
+        sample_size: int = 10_000,
+        chunk_size: int = 1_000_000,
+        maximum_bin_count: int = 1000,
+) -> (npt.NDArray, npt.NDArray):
+    # Returns the densities of each of the data sets, with shape [data sets, bins], and the bin edges they share.
+    # `bins` can be a bin count, explicit (possibly non-uniform) bin edges, one of the sampled binning methods, or any
+    # other binning method understood by `np.histogram_bin_edges`. Non-finite values, and values outside of an
+    # explicit range or explicit edges, are left out, as with `np.histogram`.
+    # The range of a stream cannot be known before it is consumed, so streams require an explicit range or explicit
+    # edges. Streams are only consumed once, so the chunks read while sampling are replayed for the counting pass.
+    datas = [convert_histogram_data_to_array_if_array_like(array) for array in arrays]
+    has_streams = any(not isinstance(data, np.ndarray) for data in datas)
+    if range_ is not None and not (np.isfinite(range_[0]) and np.isfinite(range_[1]) and range_[0] <= range_[1]):
+        raise ValueError(f'The histogram range must be finite and increasing ({range_} passed).')
+    uniform_edges = isinstance(bins, (int, np.integer, str))
+    defer_freedman_diaconis = isinstance(bins, str) and bins == 'freedman_diaconis' and has_streams
+    if isinstance(bins, str) and bins not in sampled_binning_methods:
+        if has_streams:
+            raise ValueError(f'The `{bins}` binning method is delegated to NumPy, which requires array data. Use one '
+                             f'of {sampled_binning_methods}, a bin count, or explicit bin edges for streamed data.')
+        finite_values = np.concatenate([get_finite_values(np.asarray(data)) for data in datas])
+        if finite_values.shape[0] == 0:
+            raise ValueError('The histogram data contains no finite values.')
+        bins = np.histogram_bin_edges(finite_values, bins=bins, range=range_)
+    if not isinstance(bins, (int, np.integer, str)):
+        edges = get_explicit_bin_edges(bins, dtype)
+        chunk_iterables = datas
+    else:
+        if has_streams and range_ is None:
+            raise ValueError('Streamed histogram data requires an explicit `range_` or explicit bin edges, as its '
+                             'range cannot be known before it is consumed.')
+        chunk_iterables = []
+        samples = []
+        for data in datas:
+            if not isinstance(bins, str):
+                chunk_iterables.append(data)
+            elif isinstance(data, np.ndarray):
+                chunk_iterables.append(data)
+                samples.append(get_finite_values(get_array_sample(data, sample_size)))
+            else:
+                sample, chunk_iterable = get_iterable_sample(data, sample_size)
+                chunk_iterables.append(chunk_iterable)
+                samples.append(get_finite_values(sample))
+        if range_ is None:
+            data_ranges = [data_range for data_range in (get_array_finite_range(data) for data in datas)
+                           if data_range is not None]
+            if len(data_ranges) == 0:
+                raise ValueError('The histogram data contains no finite values.')
+            range_ = (min(data_range[0] for data_range in data_ranges),
+                      max(data_range[1] for data_range in data_ranges))
+        sample = np.concatenate(samples).astype(dtype, copy=False) if len(samples) > 0 else np.array([], dtype=dtype)
+        if bins == 'freedman_diaconis' and not has_streams:
+            number_of_values = sum(count_finite_values(data, chunk_size) for data in datas)
+        else:
+            number_of_values = sample.shape[0]
+        edges_bins = freedman_diaconis_fine_bin_count if defer_freedman_diaconis else bins
+        edges = get_histogram_bin_edges(sample, bins=edges_bins, range_=range_, number_of_values=number_of_values,
+                                        dtype=dtype, maximum_bin_count=maximum_bin_count)
+    counts = np.stack([
+        accumulate_histogram_counts(iterate_data_chunks(chunk_iterable, chunk_size), edges, dtype=dtype,
+                                    uniform_edges=uniform_edges)
+        for chunk_iterable in chunk_iterables
+    ])
+    if defer_freedman_diaconis:
+        # The counts only include finite values, so they give the same number of values as for array data.
+        bin_count = get_freedman_diaconis_bin_count(sample, edges[0], edges[-1], int(np.sum(counts)),
+                                                    maximum_bin_count=maximum_bin_count)
+        counts, edges = merge_fine_histogram_bins(counts, edges, bin_count)
+    total_counts = np.maximum(np.sum(counts, axis=1, keepdims=True), 1)
+    densities = (counts / (total_counts * np.diff(edges))).astype(dtype, copy=False)
+    return densities, edges
+
+
+def merge_fine_histogram_bins(fine_counts: npt.NDArray, fine_edges: npt.NDArray,
+                              bin_count: int) -> (npt.NDArray, npt.NDArray):
+    # Merges the fine bins into the divisor of the fine bin count that is closest to the requested bin count.
+    fine_bin_count = fine_edges.shape[0] - 1
+    divisors = np.array([divisor for divisor in range(1, fine_bin_count + 1) if fine_bin_count % divisor == 0])
+    merged_bin_count = int(divisors[np.argmin(np.abs(divisors - bin_count))])
+    merge_factor = fine_bin_count // merged_bin_count
+    merged_counts = fine_counts.reshape(fine_counts.shape[0], merged_bin_count, merge_factor).sum(axis=2)
+    return merged_counts, fine_edges[::merge_factor]
+
+
+def get_finite_values(values: npt.NDArray) -> npt.NDArray:
+    finite_mask = np.isfinite(values)
+    if np.all(finite_mask):
+        return values
+    return values[finite_mask]
+
+
+def get_array_finite_range(array: npt.NDArray, chunk_size: int = 1_000_000) -> tuple[float, float] | None:
+    if array.shape[0] == 0:
+        return None
+    # The plain reductions are fast, and only need to be redone over the finite values when they are not finite.
+    range_start = np.min(array)
+    range_end = np.max(array)
+    if np.isfinite(range_start) and np.isfinite(range_end):
+        return range_start, range_end
+    range_start = None
+    range_end = None
+    for chunk in iterate_data_chunks(array, chunk_size):
+        chunk = get_finite_values(chunk)
+        if chunk.shape[0] == 0:
+            continue
+        chunk_minimum = np.min(chunk)
+        chunk_maximum = np.max(chunk)
+        range_start = chunk_minimum if range_start is None else min(range_start, chunk_minimum)
+        range_end = chunk_maximum if range_end is None else max(range_end, chunk_maximum)
+    if range_start is None:
+        return None
+    return range_start, range_end
+
+
+def count_finite_values(array: npt.NDArray, chunk_size: int = 1_000_000) -> int:
+    return sum(int(np.count_nonzero(np.isfinite(chunk))) for chunk in iterate_data_chunks(array, chunk_size))
+
+
+def convert_histogram_data_to_array_if_array_like(data: HistogramData) -> HistogramData:
+    # Plain sequences of values and array-likes (such as pandas or polars series) are treated as a single array.
+    # Other iterables are treated as a stream of array chunks.
+    if isinstance(data, np.ndarray):
+        return data.ravel()
+    if hasattr(data, '__array__'):
+        return np.asarray(data).ravel()
+    if isinstance(data, (list, tuple)) and (len(data) == 0 or np.ndim(data[0]) == 0):
+        return np.asarray(data)
+    return data
+
+
+def get_array_sample(array: npt.NDArray, sample_size: int) -> npt.NDArray:
+    # A strided sample only touches a fraction of the pages of memory-mapped arrays.
+    if array.shape[0] <= sample_size:
+        return np.asarray(array)
+    stride = array.shape[0] // sample_size
+    return np.asarray(array[::stride][:sample_size])
+
+
+def get_iterable_sample(chunks: Iterable[npt.NDArray], sample_size: int
+                        ) -> (npt.NDArray, Iterable[npt.NDArray]):
+    chunk_iterator = iter(chunks)
+    sampled_chunks = []
+    number_of_sampled_values = 0
+    for chunk in chunk_iterator:
+        chunk = np.asarray(chunk).ravel()
+        sampled_chunks.append(chunk)
+        number_of_sampled_values += chunk.shape[0]
+        if number_of_sampled_values >= sample_size:
+            break
+    if len(sampled_chunks) == 0:
+        sample = np.array([])
+    else:
+        sample = np.concatenate(sampled_chunks)[:sample_size]
+    return sample, itertools.chain(sampled_chunks, chunk_iterator)
+
+
+def iterate_data_chunks(data: HistogramData, chunk_size: int) -> Iterator[npt.NDArray]:
+    if isinstance(data, np.ndarray):
+        for chunk_start in range(0, data.shape[0], chunk_size):
+            yield data[chunk_start:chunk_start + chunk_size]
+    else:
+        for chunk in data:
+            yield np.asarray(chunk).ravel()
+
+
+def get_explicit_bin_edges(bins: npt.NDArray, dtype: npt.DTypeLike = np.float64) -> npt.NDArray:
+    edges = np.asarray(bins, dtype=dtype)
+    if edges.ndim != 1 or edges.shape[0] < 2 or not np.all(np.isfinite(edges)) or np.any(np.diff(edges) <= 0):
+        raise ValueError('Explicit bin edges must be a 1D array of at least 2 finite, strictly increasing values.')
+    return edges
+
+
+def get_histogram_bin_edges(
+        sample: npt.NDArray,
+        *,
+        bins: int | str,
+        range_: tuple[float, float],
+        number_of_values: int,
+        dtype: npt.DTypeLike = np.float64,
+        maximum_bin_count: int = 1000,
+) -> npt.NDArray:
+    range_start, range_end = range_
+    if range_start == range_end:
+        range_start, range_end = range_start - 0.5, range_end + 0.5
+    if bins == 'freedman_diaconis':
+        bin_count = get_freedman_diaconis_bin_count(sample, range_start, range_end, number_of_values,
+                                                    maximum_bin_count=maximum_bin_count)
+    elif bins == 'knuth':
+        bin_count = get_knuth_bin_count(sample, range_start, range_end, maximum_bin_count=maximum_bin_count)
+    elif isinstance(bins, str):
+        raise ValueError(f'Unknown sampled binning method `{bins}`. Known methods are {sampled_binning_methods}.')
+    else:
+        bin_count = bins
+    return np.linspace(range_start, range_end, bin_count + 1, dtype=dtype)
+
+
+def get_freedman_diaconis_bin_count(sample: npt.NDArray, range_start: float, range_end: float,
+                                    number_of_values: int, *, maximum_bin_count: int = 1000) -> int:
+    if sample.shape[0] < 2:
+        return 1
+    # The IQR is estimated from the sample, but the bin width scales with the full number of values.
+    quartile_1, quartile_3 = np.quantile(sample, [0.25, 0.75])
+    interquartile_range = quartile_3 - quartile_1
+    if interquartile_range == 0:
+        return 1
+    bin_width = 2 * interquartile_range * number_of_values ** (-1 / 3)
+    bin_count = int(np.ceil((range_end - range_start) / bin_width))
+    return int(np.clip(bin_count, 1, maximum_bin_count))
+
+
+def get_knuth_bin_count(sample: npt.NDArray, range_start: float, range_end: float, *,
+                        maximum_bin_count: int = 1000) -> int:
+    # Maximizes the log posterior of Knuth (2006) for the number of uniform bins over the sample.
+    in_range_sample = sample[(sample >= range_start) & (sample <= range_end)]
+    number_of_samples = in_range_sample.shape[0]
+    if number_of_samples < 2:
+        return 1
+    maximum_bin_count = min(maximum_bin_count, number_of_samples)
+    log_posteriors = np.empty(maximum_bin_count, dtype=np.float64)
+    for bin_count in range(1, maximum_bin_count + 1):
+        counts, _ = np.histogram(in_range_sample, bins=bin_count, range=(range_start, range_end))
+        log_posteriors[bin_count - 1] = (number_of_samples * np.log(bin_count)
+                                         + gammaln(bin_count / 2)
+                                         - bin_count * gammaln(0.5)
+                                         - gammaln(number_of_samples + bin_count / 2)
+                                         + np.sum(gammaln(counts + 0.5)))
+    return int(np.argmax(log_posteriors)) + 1
+
+
+def accumulate_histogram_counts(chunks: Iterable[npt.NDArray], edges: npt.NDArray, *,
+                                dtype: npt.DTypeLike = np.float64, uniform_edges: bool = True) -> npt.NDArray:
+    # Uniform edges are passed to `np.histogram` as a bin count and range, so it uses its integer bin arithmetic
+    # rather than searching the edges. Values outside of the edges (including non-finite values) are not counted.
+    bin_count = edges.shape[0] - 1
+    counts = np.zeros(bin_count, dtype=np.int64)
+    for chunk in chunks:
+        chunk = np.asarray(chunk).astype(dtype, copy=False)
+        if uniform_edges:
+            chunk_counts, _ = np.histogram(chunk, bins=bin_count, range=(edges[0], edges[-1]))
+        else:
+            chunk_counts, _ = np.histogram(chunk, bins=edges)
+        counts += chunk_counts
+    return counts
@@ -1,6 +1,13 @@
 import numpy as np
+import pytest
+from scipy import stats
 
-from gobo.internal.corner_plot import create_segments_for_indexes
+import gobo.internal.corner_plot
+
+from gobo.internal.corner_plot import create_segments_for_indexes, evaluate_2d_kde_on_grid, \
+    get_grid_resolution_for_pixel_size, evaluate_kde_at_positions, get_indexes_for_thresholds, \
+    get_contour_thresholds_for_credible_intervals, create_2d_histogram_figure, create_corner_plot, \
+    create_1d_kde_credible_interval_figure, create_2d_kde_credible_interval_figure
 
 
 def test_create_segments_for_indexes_handles_empty_segments():
@@ -15,3 +22,98 @@ def test_create_segments_for_indexes_handles_empty_segments():
                 for interval_segment_plotting_positions in interval_segment_plotting_positions_array])
     assert all([interval_segment_values.shape[0] > 0
                 for interval_segment_values in interval_segment_values_array])
+
+
+def test_evaluate_2d_kde_on_grid_with_memory_budget_matches_unbudgeted_evaluation():
+    random_number_generator = np.random.default_rng(0)
+    kde = stats.gaussian_kde(random_number_generator.normal(size=(2, 100)))
+    x_positions = np.linspace(-3, 3, 30)
+    y_positions = np.linspace(-3, 3, 20)
+
+    unbudgeted_z_meshgrid = evaluate_2d_kde_on_grid(kde, x_positions, y_positions)
+    budgeted_z_meshgrid = evaluate_2d_kde_on_grid(kde, x_positions, y_positions, memory_budget=2500)
+
+    assert budgeted_z_meshgrid.shape == (20, 30)
+    assert np.allclose(budgeted_z_meshgrid, unbudgeted_z_meshgrid)
+
+
+def test_evaluate_2d_kde_on_grid_raises_when_memory_budget_cannot_hold_a_row():
+    random_number_generator = np.random.default_rng(0)
+    kde = stats.gaussian_kde(random_number_generator.normal(size=(2, 100)))
+    positions = np.linspace(-3, 3, 30)
+
+    with pytest.raises(ValueError):
+        evaluate_2d_kde_on_grid(kde, positions, positions, memory_budget=100)
+
+
+def test_kde_figure_raises_for_grid_resolution_below_two():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=(2, 100))
+
+    with pytest.raises(ValueError):
+        create_2d_kde_credible_interval_figure(array[0], array[1], grid_resolution=1)
+
+
+def test_corner_plot_derives_kde_grid_resolution_from_subfigure_size(monkeypatch):
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=(100, 2))
+    evaluated_grid_shapes = []
+    original_evaluate_2d_kde_on_grid = gobo.internal.corner_plot.evaluate_2d_kde_on_grid
+
+    def spy_evaluate_2d_kde_on_grid(kde, x_positions, y_positions, **kwargs):
+        evaluated_grid_shapes.append((y_positions.shape[0], x_positions.shape[0]))
+        return original_evaluate_2d_kde_on_grid(kde, x_positions, y_positions, **kwargs)
+
+    monkeypatch.setattr(gobo.internal.corner_plot, 'evaluate_2d_kde_on_grid', spy_evaluate_2d_kde_on_grid)
+    create_corner_plot(array, marginal_1d_figure_function=create_1d_kde_credible_interval_figure,
+                       marginal_2d_figure_function=create_2d_kde_credible_interval_figure, subfigure_size=200)
+
+    assert evaluated_grid_shapes == [(400, 400)]
+
+
+def test_get_grid_resolution_for_pixel_size_is_bounded():
+    assert get_grid_resolution_for_pixel_size(200) == 400
+    assert get_grid_resolution_for_pixel_size(10) == 50
+    assert get_grid_resolution_for_pixel_size(5000) == 1000
+
+
+def test_float32_1d_kde_credible_interval_bounds_match_float64():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=1000)
+    credible_intervals = np.array([0.6827, 0.9545, 0.9973])
+    bounds_by_dtype = {}
+    for dtype in [np.float32, np.float64]:
+        typed_array = array.astype(dtype)
+        kde = stats.gaussian_kde(typed_array)
+        positions = np.linspace(-4, 4, 400, dtype=dtype)
+        values = evaluate_kde_at_positions(kde, positions[np.newaxis, :], dtype=dtype)
+        assert values.dtype == dtype
+        indexes = get_indexes_for_thresholds(credible_intervals, positions, values)
+        bounds_by_dtype[dtype] = positions[indexes]
+    grid_spacing = 8 / 399
+
+    assert np.allclose(bounds_by_dtype[np.float32], bounds_by_dtype[np.float64], rtol=0, atol=grid_spacing)
+
+
+def test_float32_2d_kde_contour_thresholds_match_float64():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=(2, 1000))
+    credible_intervals = np.array([0.39346934, 0.86466472, 0.988891])
+    thresholds_by_dtype = {}
+    for dtype in [np.float32, np.float64]:
+        kde = stats.gaussian_kde(array.astype(dtype))
+        positions = np.linspace(-4, 4, 200, dtype=dtype)
+        z_meshgrid = evaluate_2d_kde_on_grid(kde, positions, positions, dtype=dtype)
+        assert z_meshgrid.dtype == dtype
+        thresholds_by_dtype[dtype] = get_contour_thresholds_for_credible_intervals(z_meshgrid, credible_intervals)
+
+    assert np.allclose(thresholds_by_dtype[np.float32], thresholds_by_dtype[np.float64], rtol=1e-3)
+
+
+def test_float32_2d_histogram_figure_emits_float32_data():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=(2, 1000))
+
+    figure_ = create_2d_histogram_figure(array[0], array[1], dtype=np.float32)
+
+    assert figure_.renderers[0].data_source.data['image'][0].dtype == np.float32
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from gobo.internal.histogram import create_multi_histogram_densities, get_knuth_bin_count, \
+    accumulate_histogram_counts
+
+
+def test_streamed_histogram_densities_match_numpy_histogram():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=10_000)
+    expected_densities, expected_edges = np.histogram(array, bins=30, density=True)
+    chunks = (array[chunk_start:chunk_start + 1000] for chunk_start in range(0, array.shape[0], 1000))
+
+    densities, edges = create_multi_histogram_densities(
+        [chunks], bins=30, range_=(expected_edges[0], expected_edges[-1]))
+
+    assert np.allclose(edges, expected_edges)
+    assert np.allclose(densities[0], expected_densities)
+
+
+def test_multi_histogram_densities_share_edges_covering_all_data_sets():
+    random_number_generator = np.random.default_rng(0)
+    array0 = random_number_generator.normal(size=5000)
+    array1 = random_number_generator.normal(loc=5, size=5000)
+
+    densities, edges = create_multi_histogram_densities([array0, array1], bins='freedman_diaconis')
+
+    assert densities.shape == (2, edges.shape[0] - 1)
+    assert edges[0] == np.min(array0)
+    assert edges[-1] == np.max(array1)
+    assert np.allclose(np.sum(densities * np.diff(edges), axis=1), 1)
+
+
+def test_knuth_bin_count_prefers_fewer_bins_for_uniform_data():
+    random_number_generator = np.random.default_rng(0)
+    uniform_sample = random_number_generator.uniform(size=2000)
+    normal_sample = random_number_generator.normal(size=2000)
+
+    uniform_bin_count = get_knuth_bin_count(uniform_sample, 0, 1)
+    normal_bin_count = get_knuth_bin_count(normal_sample, np.min(normal_sample), np.max(normal_sample))
+
+    assert uniform_bin_count < normal_bin_count
+
+
+def test_accumulate_histogram_counts_matches_numpy_histogram_for_edge_aligned_values():
+    array = np.array([0.0, 0.3, 0.6, 0.9, 1.0])
+    expected_counts, edges = np.histogram(array, bins=10)
+
+    counts = accumulate_histogram_counts([array], edges)
+
+    assert np.array_equal(counts, expected_counts)
+
+
+def test_accumulate_histogram_counts_matches_numpy_histogram_for_rounded_values():
+    random_number_generator = np.random.default_rng(0)
+    for bin_count in range(1, 60):
+        array = np.round(random_number_generator.normal(size=200), 1)
+        expected_counts, edges = np.histogram(array, bins=bin_count)
+
+        counts = accumulate_histogram_counts([array[:100], array[100:]], edges)
+
+        assert np.array_equal(counts, expected_counts)
+
+
+def test_streamed_normal_histogram_matches_numpy_histogram():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=1_000_000)
+    expected_densities, expected_edges = np.histogram(array, bins=30, range=(-4, 4), density=True)
+    chunks = (array[chunk_start:chunk_start + 100_000] for chunk_start in range(0, array.shape[0], 100_000))
+
+    densities, edges = create_multi_histogram_densities([chunks], bins=30, range_=(-4, 4))
+
+    assert np.allclose(edges, expected_edges)
+    assert np.allclose(densities[0], expected_densities)
+
+
+def test_streamed_histogram_without_a_range_raises_before_reading_any_chunks():
+    read_chunk_count = 0
+
+    def generate_chunks():
+        nonlocal read_chunk_count
+        for _ in range(10):
+            read_chunk_count += 1
+            yield np.zeros(100)
+
+    with pytest.raises(ValueError):
+        create_multi_histogram_densities([generate_chunks()], bins=30)
+    assert read_chunk_count == 0
+
+
+def test_streamed_histogram_with_explicit_edges_excludes_values_outside_of_the_edges():
+    array = np.linspace(-3, 3, 10_000)
+    edges = np.linspace(-1, 1, 11)
+    expected_densities, _ = np.histogram(array, bins=edges, density=True)
+    chunks = (array[chunk_start:chunk_start + 1000] for chunk_start in range(0, array.shape[0], 1000))
+
+    densities, _ = create_multi_histogram_densities([chunks], bins=edges)
+
+    assert np.allclose(densities[0], expected_densities)
+
+
+def test_array_histogram_delegates_numpy_binning_methods_and_non_uniform_edges():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=10_000)
+    for bins in ['auto', 'fd', 'sturges', np.array([-4, -1, -0.5, 0, 2, 4])]:
+        expected_densities, expected_edges = np.histogram(array, bins=bins, density=True)
+
+        densities, edges = create_multi_histogram_densities([array], bins=bins)
+
+        assert np.allclose(edges, expected_edges)
+        assert np.allclose(densities[0], expected_densities)
+
+
+def test_freedman_diaconis_bin_count_ignores_non_finite_values():
+    random_number_generator = np.random.default_rng(0)
+    finite_array = random_number_generator.normal(size=10_000)
+    array = np.concatenate([finite_array, np.full(90_000, np.nan)])
+
+    _, expected_edges = create_multi_histogram_densities([finite_array], bins='freedman_diaconis',
+                                                         sample_size=100_000)
+    _, edges = create_multi_histogram_densities([array], bins='freedman_diaconis', sample_size=100_000)
+
+    assert np.array_equal(edges, expected_edges)
+
+
+def test_streamed_freedman_diaconis_bin_count_uses_the_full_number_of_values():
+    random_number_generator = np.random.default_rng(0)
+    array = random_number_generator.normal(size=100_000)
+    chunks = (array[chunk_start:chunk_start + 1000] for chunk_start in range(0, array.shape[0], 1000))
+    expected_bin_count = np.histogram_bin_edges(array, bins='fd').shape[0] - 1
+
+    densities, edges = create_multi_histogram_densities([chunks], bins='freedman_diaconis', sample_size=1000,
+                                                        range_=(np.min(array), np.max(array)))
+
+    assert abs((edges.shape[0] - 1) - expected_bin_count) / expected_bin_count < 0.1
+    assert np.isclose(np.sum(densities[0] * np.diff(edges)), 1)
+
+
+def test_histogram_densities_exclude_non_finite_values():
+    densities, edges = create_multi_histogram_densities([np.array([np.nan, 1.0, 2.0, 3.0, np.inf])], bins=3)
+
+    assert np.allclose(edges, [1, 5 / 3, 7 / 3, 3])
+    assert np.allclose(densities[0], [0.5, 0.5, 0.5])
+
+
+def test_histogram_densities_raise_when_no_values_are_finite():
+    with pytest.raises(ValueError):
+        create_multi_histogram_densities([np.array([np.nan, np.nan])], bins=10)
@@ -0,0 +1,168 @@
+import numpy as np
+import pytest
+from bokeh.document import Document
+
+from bokeh.models import CustomJS
+
+from gobo.internal.high_level.light_curve import LightCurveCollection, fold_and_bin_light_curve, \
+    add_light_curve_viewer_to_document, create_light_curve_viewer, create_binned_folded_light_curve_figures, \
+    create_folded_light_curve_period_viewer
+
+
+def test_light_curve_collection_slices_light_curves_from_concatenated_store():
+    light_curves = [(np.arange(3, dtype=np.float64), np.arange(3, dtype=np.float64) * 10),
+                    (np.array([], dtype=np.float64), np.array([], dtype=np.float64)),
+                    (np.arange(2, dtype=np.float64) + 100, np.arange(2, dtype=np.float64) + 200)]
+
+    light_curve_collection = LightCurveCollection.from_light_curves(light_curves)
+
+    assert len(light_curve_collection) == 3
+    assert np.array_equal(light_curve_collection.offsets, [0, 3, 3, 5])
+    for index, (times, fluxes) in enumerate(light_curves):
+        assert np.array_equal(light_curve_collection[index][0], times)
+        assert np.array_equal(light_curve_collection[index][1], fluxes)
+
+
+def test_light_curve_collection_round_trips_through_memory_mapped_files(tmp_path):
+    light_curve_collection = LightCurveCollection.from_light_curves(
+        [(np.arange(4, dtype=np.float64), np.ones(4)), (np.arange(2, dtype=np.float64), np.zeros(2))])
+
+    light_curve_collection.save(tmp_path)
+    loaded_light_curve_collection = LightCurveCollection.load(tmp_path, memory_map=True)
+
+    assert isinstance(loaded_light_curve_collection.times, np.memmap)
+    assert np.array_equal(loaded_light_curve_collection[1][0], light_curve_collection[1][0])
+    assert np.array_equal(loaded_light_curve_collection[1][1], light_curve_collection[1][1])
+
+
+def test_light_curve_collection_accepts_lists():
+    light_curve_collection = LightCurveCollection([0.0, 1.0, 2.0], [5.0, 6.0, 7.0], [0, 1, 3])
+
+    assert light_curve_collection.offsets.dtype == np.int64
+    assert np.array_equal(light_curve_collection[1][1], [6.0, 7.0])
+
+
+def test_light_curve_viewer_document_switches_displayed_light_curve():
+    light_curve_collection = LightCurveCollection.from_light_curves(
+        [(np.arange(3, dtype=np.float64), np.zeros(3)), (np.arange(2, dtype=np.float64) + 10, np.ones(2))])
+    document = Document()
+    add_light_curve_viewer_to_document(document, light_curve_collection, names=['first', 'second'])
+    spinner, light_curve_figure = document.roots[0].children
+    light_curve_source = light_curve_figure.renderers[0].data_source
+
+    spinner.value = 1
+
+    assert spinner.mode == 'int'
+    assert np.array_equal(light_curve_source.data['time'], [10.0, 11.0])
+    assert np.array_equal(light_curve_source.data['flux'], [1.0, 1.0])
+    assert light_curve_figure.title.text == 'second'
+
+
+def test_light_curve_viewer_normalizes_negative_initial_index():
+    light_curve_collection = LightCurveCollection.from_light_curves(
+        [(np.arange(3, dtype=np.float64), np.zeros(3)), (np.arange(2, dtype=np.float64) + 10, np.ones(2))])
+
+    light_curve_viewer = create_light_curve_viewer(light_curve_collection, initial_index=-1)
+    spinner, light_curve_figure = light_curve_viewer.children
+
+    assert spinner.value == 1
+    assert light_curve_figure.title.text == 'Light curve 1'
+    assert np.array_equal(light_curve_figure.renderers[0].data_source.data['time'], [10.0, 11.0])
+
+
+def test_standalone_light_curve_viewer_ships_store_and_offsets_to_callback():
+    light_curve_collection = LightCurveCollection.from_light_curves(
+        [(np.arange(3, dtype=np.float64), np.zeros(3)), (np.arange(2, dtype=np.float64) + 10, np.ones(2))])
+
+    light_curve_viewer = create_light_curve_viewer(light_curve_collection)
+    spinner, light_curve_figure = light_curve_viewer.children
+    callback = spinner.js_property_callbacks['change:value'][0]
+
+    assert isinstance(callback, CustomJS)
+    assert callback.args['offsets'] == [0, 3, 5]
+    assert callback.args['names'] is None
+    assert callback.args['light_curve_source'] is light_curve_figure.renderers[0].data_source
+    assert np.array_equal(callback.args['store_source'].data['time'], light_curve_collection.times)
+    assert np.array_equal(callback.args['store_source'].data['flux'], light_curve_collection.fluxes)
+
+
+def test_fold_and_bin_light_curve_matches_per_period_folding():
+    random_number_generator = np.random.default_rng(0)
+    times = np.sort(random_number_generator.uniform(0, 30, size=500))
+    fluxes = random_number_generator.normal(size=500)
+    periods = np.array([0.7, 2.5, 3.1])
+    number_of_bins = 20
+
+    bin_centers, binned_fluxes = fold_and_bin_light_curve(times, fluxes, periods, number_of_bins=number_of_bins,
+                                                          epoch=0, memory_budget=30_000)
+
+    assert np.allclose(bin_centers, (np.arange(number_of_bins) + 0.5) / number_of_bins)
+    for period, period_binned_fluxes in zip(periods, binned_fluxes):
+        bin_indexes = np.floor(np.mod(times / period, 1) * number_of_bins).astype(np.int64)
+        expected_binned_fluxes = [np.mean(fluxes[bin_indexes == bin_index]) for bin_index in range(number_of_bins)]
+        assert np.allclose(period_binned_fluxes, expected_binned_fluxes)
+
+
+def test_fold_and_bin_light_curve_ignores_non_finite_times_and_fluxes():
+    times = np.array([0.1, 0.2, np.nan, 0.6, 0.7])
+    fluxes = np.array([1.0, np.nan, 5.0, 3.0, 5.0])
+
+    _, binned_fluxes = fold_and_bin_light_curve(times, fluxes, [1.0], number_of_bins=2, epoch=0)
+
+    assert np.allclose(binned_fluxes, [[1.0, 4.0]])
+
+
+@pytest.mark.parametrize('periods', [[1.0, 0.0], [-1.0], [np.nan]])
+def test_fold_and_bin_light_curve_raises_for_non_positive_periods(periods):
+    with pytest.raises(ValueError):
+        fold_and_bin_light_curve(np.arange(10, dtype=np.float64), np.ones(10), periods)
+
+
+def test_fold_and_bin_light_curve_raises_for_too_few_bins():
+    with pytest.raises(ValueError):
+        fold_and_bin_light_curve(np.arange(10, dtype=np.float64), np.ones(10), [1.0], number_of_bins=0)
+
+
+def test_fold_and_bin_light_curve_raises_when_memory_budget_cannot_hold_a_period():
+    with pytest.raises(ValueError):
+        fold_and_bin_light_curve(np.arange(10, dtype=np.float64), np.ones(10), [1.0, 2.0], memory_budget=1)
+
+
+def test_binned_folded_light_curve_figures_have_one_titled_figure_per_period():
+    times = np.linspace(0, 10, 100)
+
+    figures = create_binned_folded_light_curve_figures(times, np.sin(times), [1.5, 1234567.0], number_of_bins=10)
+
+    assert [figure_.title.text for figure_ in figures] == ['Period 1.5', 'Period 1.23457e+06']
+    assert all(figure_.renderers[0].data_source.data['flux'].shape == (10,) for figure_ in figures)
+
+
+def test_folded_light_curve_period_viewer_stores_bins_for_every_period():
+    times = np.linspace(0, 10, 100)
+    fluxes = np.sin(times)
+    periods = [1.5, 2.5, 1234567.0]
+    _, binned_fluxes = fold_and_bin_light_curve(times, fluxes, periods, number_of_bins=10)
+
+    folded_light_curve_viewer = create_folded_light_curve_period_viewer(times, fluxes, periods, number_of_bins=10)
+    slider, folded_light_curve_figure = folded_light_curve_viewer.children
+    callback = slider.js_property_callbacks['change:value'][0]
+    stored_fluxes = callback.args['store_source'].data['flux']
+
+    assert slider.end == 2
+    assert not slider.disabled
+    assert callback.args['number_of_bins'] == 10
+    assert callback.args['titles'] == ['Period 1.5', 'Period 2.5', 'Period 1.23457e+06']
+    assert folded_light_curve_figure.title.text == 'Period 1.5'
+    for period_index in range(len(periods)):
+        assert np.array_equal(stored_fluxes[period_index * 10:(period_index + 1) * 10], binned_fluxes[period_index],
+                              equal_nan=True)
+
+
+def test_folded_light_curve_period_viewer_disables_slider_for_a_single_period():
+    times = np.linspace(0, 10, 100)
+
+    folded_light_curve_viewer = create_folded_light_curve_period_viewer(times, np.sin(times), 2.5, number_of_bins=10)
+    slider, _ = folded_light_curve_viewer.children
+
+    assert slider.disabled
+    assert slider.end == 1